@@ -0,0 +1,34 @@
+import configparser
+import os
+from functools import lru_cache
+
+DEFAULT_CONFIG_PATH = '.config.ini'
+
+def get_config_path():
+    """
+    Resolve the pipeline config path.
+
+    Returns:
+        str: Value of the SPOTIFY_ETL_CONFIG environment variable, or
+             '.config.ini' in the working directory when it is not set
+    """
+    return os.environ.get('SPOTIFY_ETL_CONFIG', DEFAULT_CONFIG_PATH)
+
+@lru_cache(maxsize=1)
+def load_config(path):
+    """
+    Read and parse an ini config file once per path.
+
+    Args:
+        path (str): Path to the ini file
+
+    Returns:
+        configparser.ConfigParser: Parsed configuration
+
+    Raises:
+        FileNotFoundError: If the config file cannot be read
+    """
+    config = configparser.ConfigParser()
+    if not config.read(path):
+        raise FileNotFoundError(f"Config file not found: {path}")
+    return config
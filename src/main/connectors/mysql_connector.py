@@ -1,60 +1,141 @@
+import threading
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, pooling
 from loguru import logger
 
+try:
+    # mysqlclient (libmysqlclient-backed), used when connector-python's C extension is missing
+    import MySQLdb
+except ImportError:
+    MySQLdb = None
+
+DB_ERRORS = (Error, MySQLdb.Error) if MySQLdb else (Error,)
+
 class MySqlConnection:
     """
     Singleton class to manage MySQL database connection.
+
+    Prefers mysql-connector-python's C extension (use_pure=False). If that
+    extension is not built for this install, falls back to the `mysqlclient`
+    driver, which must then be installed (`pip install mysqlclient`).
     """
     _instance = None
+    _lock = threading.Lock()
 
     def __init__(self, config):
         if MySqlConnection._instance is not None:
             raise Exception("Use get_instance() instead of creating a new object")
         self.config = config
+        self.pool = None
         self.connection = None
         self.connect_to_database()
     
     @classmethod
     def get_instance(cls, config=None):
         if cls._instance is None:
-            cls._instance = cls(config)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(config)
         return cls._instance
     
     def connect_to_database(self):
         """
-        Private method to create a MySQL database connection.
+        Private method to create a MySQL connection pool and check out a connection.
         """
         try:
-            self.connection = mysql.connector.connect(
+            if not mysql.connector.HAVE_CEXT and MySQLdb is not None:
+                self.connection = MySQLdb.connect(
+                    host=self.config['mysql-auth']['HOST'],
+                    user=self.config['mysql-auth']['USER'],
+                    password=self.config['mysql-auth']['PASSWORD'],
+                    database=self.config['mysql-auth']['DATABASE']
+                )
+                logger.info("Connected to MySQL with mysqlclient driver.")
+                return
+            if not mysql.connector.HAVE_CEXT:
+                logger.warning("MySQL C extension unavailable, using pure-Python protocol; install mysqlclient")
+            self.pool = pooling.MySQLConnectionPool(
+                pool_name="spotify_pool",
+                pool_size=10,
                 host=self.config['mysql-auth']['HOST'],
                 user=self.config['mysql-auth']['USER'],
                 password=self.config['mysql-auth']['PASSWORD'],
-                database=self.config['mysql-auth']['DATABASE']
+                database=self.config['mysql-auth']['DATABASE'],
+                # Requesting the C extension when it is not built raises ImportError
+                use_pure=not mysql.connector.HAVE_CEXT
             )
-        except Error as e:
+            self.connection = self.pool.get_connection()
+        except DB_ERRORS as e:
             logger.error(f"Error connecting to MySQL: {e}")
             raise
 
+    def bulk_insert(self, table, cols, rows, batch=1000):
+        """
+        Insert rows into a table in batches with executemany.
+
+        The connector rewrites each executemany INSERT into a single multi-row
+        statement, so every batch costs one round trip and one commit. Each
+        call checks out its own connection from the pool, when there is one.
+
+        Args:
+            table (str): Target table name
+            cols (list[str]): Column names, in the same order as each row
+            rows (list[tuple]): Row values to insert
+            batch (int): Number of rows per INSERT statement
+
+        Returns:
+            int: Number of rows inserted
+        """
+        query = f"INSERT INTO {table} ({','.join(cols)}) VALUES ({','.join(['%s'] * len(cols))})"
+        # Check out a pooled connection per call so concurrent inserts can run in
+        # parallel; the mysqlclient fallback has no pool and uses self.connection
+        connection = self.pool.get_connection() if self.pool else self.connection
+        cursor = connection.cursor()
+        inserted = 0
+        try:
+            for start in range(0, len(rows), batch):
+                chunk = rows[start:start + batch]
+                cursor.executemany(query, chunk)
+                connection.commit()
+                inserted += len(chunk)
+            logger.info(f"Inserted {inserted} rows into {table}")
+            return inserted
+        except DB_ERRORS as e:
+            connection.rollback()
+            logger.error(f"Bulk insert into {table} failed after {inserted} rows: {e}")
+            raise
+        finally:
+            cursor.close()
+            if self.pool:
+                # Returns the pooled connection to the pool
+                connection.close()
+
+    def is_connected(self):
+        """
+        Check whether the underlying connection is open, for either driver.
+        """
+        if self.connection is None:
+            return False
+        if MySQLdb is not None and isinstance(self.connection, MySQLdb.connections.Connection):
+            return bool(self.connection.open)
+        return self.connection.is_connected()
+
     def close(self):
         """
         Close the MySQL database connection.
         """
-        if self.connection and self.connection.is_connected():
+        if self.is_connected():
             self.connection.close()
             logger.info("MySQL connection closed.")
 
 # Check for connection
 if __name__ == "__main__":
-    import configparser
-
-    config = configparser.ConfigParser()
-    path = '/Users/akshatsharma/Desktop/Portfolio_Projects/Spotify_Data_Pipeline/spotifyETL/resources/config.ini'
-    config.read(path)
+    from src.main.config_loader import get_config_path, load_config
 
     try:
+        config = load_config(get_config_path())
         db_conn = MySqlConnection.get_instance(config)
-        if db_conn.connection.is_connected():
+        if db_conn.is_connected():
             logger.info("MySQL connection is successful.")
         db_conn.close()
         
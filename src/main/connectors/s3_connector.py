@@ -1,8 +1,19 @@
+import threading
 import boto3
+from botocore.config import Config
 from loguru import logger
 
+# Keep TLS connections warm across uploads and back off adaptively on throttling
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    s3={'addressing_style': 'virtual', 'use_accelerate_endpoint': False}
+)
+
 class S3Connection:
     _instance = None
+    _lock = threading.Lock()
 
     def __init__(self,config):
         if S3Connection._instance is not None:
@@ -14,7 +25,9 @@ class S3Connection:
     @classmethod
     def get_instance(cls,config=None):
         if cls._instance is None:
-            cls._instance = cls(config)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(config)
         return cls._instance
     
     def connect_to_s3(self):
@@ -24,7 +37,8 @@ class S3Connection:
                 's3',
                 aws_access_key_id=self.config['aws-auth']['aws_access_key_id'],
                 aws_secret_access_key=self.config['aws-auth']['aws_secret_access_key'],
-                region_name=self.config['aws-auth']['region_name']
+                region_name=self.config['aws-auth']['region_name'],
+                config=S3_CLIENT_CONFIG
             )
             logger.info("Connected to AWS S3 successfully.")
             return self.s3_client
@@ -1,9 +1,58 @@
+import asyncio
+import os
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+import orjson
+import requests
 import spotipy
 from loguru import logger
 from spotipy.oauth2 import SpotifyClientCredentials
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+PLAYLIST_TRACK_FIELDS = (
+    'items(added_at,track(id,name,duration_ms,popularity,external_urls,'
+    'album(id,name,release_date,total_tracks,external_urls,artists),'
+    'artists(id,name,external_urls))),next,total'
+)
+PAGE_LIMIT = 100
+MAX_CONCURRENT_PAGES = 5
+# Mirror spotipy's own urllib3 retry policy for the concurrent page fetches
+MAX_PAGE_RETRIES = 3
+PAGE_RETRY_BACKOFF = 0.3
+# Not '.cache': spotipy's CacheFileHandler writes its token to a file with that name
+CACHE_DIR = Path('.playlist_cache')
+# Popularity drifts without changing snapshot_id, so cached tracks expire after a day
+CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+
+class OrjsonSpotify(spotipy.Spotify):
+    """
+    spotipy client that decodes API responses with orjson.
+
+    spotipy parses every response with `response.json()` (stdlib json). A
+    response hook on the client's session swaps that for `orjson.loads`, which
+    is several times faster on the nested playlist track pages.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if isinstance(self._session, requests.Session):
+            self._session.hooks['response'].append(self._decode_with_orjson)
+
+    @staticmethod
+    def _decode_with_orjson(response, *args, **kwargs):
+        # orjson.JSONDecodeError subclasses ValueError, which spotipy already handles
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
 class SpotifyConnection:
     _instance = None
+    _lock = threading.Lock()
 
     def __init__(self,config):
         if SpotifyConnection._instance is not None:
@@ -15,7 +64,9 @@ class SpotifyConnection:
     @classmethod
     def get_instance(cls,config=None):
         if cls._instance is None:
-            cls._instance = cls(config)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(config)
         return cls._instance
     
     def connectAPI(self):
@@ -25,18 +76,171 @@ class SpotifyConnection:
             client_secret=self.config["spotify-auth"]["CLIENT_SECRET_KEY"]
             )
 
-            self.spotify_client = spotipy.Spotify(client_credentials_manager=credentials)
+            self.spotify_client = OrjsonSpotify(client_credentials_manager=credentials)
             logger.info(f"Connected and object created as {self.spotify_client}")
 
-        except Exception as e:
-            logger.info(f"API connection got some Error {e}")
+        except Exception:
+            logger.exception("API connection failed")
 
     def get_playlist_track(self,playlist_id):
         if self.spotify_client is None:
             raise Exception("Spotify client not initialized")
         
+        items = []
+        for page in self.iter_playlist_tracks(playlist_id):
+            items.extend(page['items'])
+        return {'items': items}
+
+    def iter_playlist_tracks(self, playlist_id, fields=PLAYLIST_TRACK_FIELDS, use_cache=False):
+        """
+        Yield every page of a playlist's tracks, following `next` links.
+
+        When `use_cache` is set, the playlist's `snapshot_id` is fetched first
+        and compared against the on-disk cache. If the playlist has not changed
+        and the cache is younger than CACHE_MAX_AGE_SECONDS, the cached tracks
+        are returned as a single page without paging through the API; otherwise
+        the fetched tracks are written back to the cache.
+
+        Args:
+            playlist_id (str): Spotify playlist identifier
+            fields (str): Spotify `fields` filter limiting the response payload
+            use_cache (bool): Whether to validate and reuse the on-disk cache (opt-in)
+
+        Yields:
+            dict: A playlist tracks page containing an 'items' array
+        """
+        if self.spotify_client is None:
+            raise Exception("Spotify client not initialized")
+
         try:
-            return self.spotify_client.playlist_tracks(playlist_id)
+            if not use_cache:
+                yield from self._fetch_playlist_pages(playlist_id, fields)
+                return
+
+            snapshot_id = self.spotify_client.playlist(playlist_id, fields='snapshot_id')['snapshot_id']
+            cached = self._read_cache(playlist_id)
+            if (cached and cached['snapshot_id'] == snapshot_id and cached['fields'] == fields
+                    and time.time() - cached.get('fetched_at', 0) < CACHE_MAX_AGE_SECONDS):
+                logger.info(f"Playlist {playlist_id} unchanged, using cached tracks")
+                yield {'items': cached['items'], 'next': None}
+                return
+
+            items = []
+            for page in self._fetch_playlist_pages(playlist_id, fields):
+                items.extend(page['items'])
+                yield page
+            self._write_cache(playlist_id, {
+                'snapshot_id': snapshot_id, 'fields': fields, 'fetched_at': time.time(), 'items': items
+            })
         except Exception as e:
             logger.error(f"Failed to get playlist tracks: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    def _fetch_playlist_pages(self, playlist_id, fields):
+        """
+        Page through the playlist tracks endpoint.
+
+        Once the first page reports the playlist `total`, the remaining page
+        offsets are known, so they are fetched concurrently with aiohttp when it
+        is installed. Without aiohttp, or when called from inside a running event
+        loop, pages are fetched one after another by following `next`.
+        """
+        results = self.spotify_client.playlist_items(
+            playlist_id, fields=fields, limit=PAGE_LIMIT, additional_types=('track',)
+        )
+        yield results
+
+        offsets = list(range(PAGE_LIMIT, results.get('total') or 0, PAGE_LIMIT))
+        if offsets and results.get('next') and aiohttp is not None and not self._in_event_loop():
+            # Reuse the endpoint spotipy paged from, minus its query string
+            endpoint = urlunsplit(urlsplit(results['next'])._replace(query='', fragment=''))
+            yield from asyncio.run(self._fetch_pages_concurrently(playlist_id, endpoint, fields, offsets))
+            return
+
+        while results.get('next'):
+            results = self.spotify_client.next(results)
+            yield results
+
+    @staticmethod
+    def _in_event_loop():
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+
+    async def _fetch_pages_concurrently(self, playlist_id, endpoint, fields, offsets):
+        """
+        Fetch the given page offsets in parallel, returning pages in offset order.
+
+        Requests bypass spotipy, so its retry policy is reproduced here: status
+        codes in spotipy.Spotify.default_retry_codes and connection errors are
+        retried up to MAX_PAGE_RETRIES times, honouring Retry-After on 429.
+        """
+        # Coupled to spotipy internals: _auth_headers() is private, but it is the
+        # only way to reuse the client's (auto-refreshed) token for any auth manager
+        headers = self.spotify_client._auth_headers()
+        retry_codes = set(spotipy.Spotify.default_retry_codes)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+        def retry_delay(attempt, response=None):
+            if response is not None and response.status == 429:
+                try:
+                    return float(response.headers.get('Retry-After', ''))
+                except ValueError:
+                    pass
+            return PAGE_RETRY_BACKOFF * (2 ** attempt)
+
+        async def fetch_page(session, offset):
+            params = {'offset': offset, 'limit': PAGE_LIMIT, 'fields': fields, 'additional_types': 'track'}
+            async with semaphore:
+                for attempt in range(MAX_PAGE_RETRIES + 1):
+                    last_attempt = attempt == MAX_PAGE_RETRIES
+                    try:
+                        async with session.get(endpoint, params=params) as response:
+                            if response.status in retry_codes and not last_attempt:
+                                delay = retry_delay(attempt, response)
+                                logger.warning(
+                                    f"Page at offset {offset} returned {response.status}, retrying in {delay}s"
+                                )
+                                await asyncio.sleep(delay)
+                                continue
+                            response.raise_for_status()
+                            return orjson.loads(await response.read())
+                    except aiohttp.ClientConnectionError as e:
+                        if last_attempt:
+                            raise
+                        delay = retry_delay(attempt)
+                        logger.warning(f"Page at offset {offset} failed with {e!r}, retrying in {delay}s")
+                        await asyncio.sleep(delay)
+
+        async with aiohttp.ClientSession(headers=headers) as session:
+            pages = await asyncio.gather(*(fetch_page(session, offset) for offset in offsets))
+        logger.info(f"Fetched {len(pages)} additional pages concurrently for playlist {playlist_id}")
+        return pages
+
+    @staticmethod
+    def _cache_path(playlist_id):
+        return CACHE_DIR / f"playlist_{playlist_id}.json"
+
+    def _read_cache(self, playlist_id):
+        """Return the cached playlist payload, or None if missing or unreadable."""
+        try:
+            return orjson.loads(self._cache_path(playlist_id).read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable playlist cache for {playlist_id}: {e}")
+            return None
+
+    def _write_cache(self, playlist_id, payload):
+        """Atomically write the playlist payload to the on-disk cache; failures only warn."""
+        cache_path = self._cache_path(playlist_id)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            tmp_path.write_bytes(orjson.dumps(payload))
+            os.replace(tmp_path, cache_path)
+            logger.info(f"Cached {len(payload['items'])} tracks for playlist {playlist_id}")
+        except OSError as e:
+            logger.warning(f"Could not write playlist cache for {playlist_id}: {e}")
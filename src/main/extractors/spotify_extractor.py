@@ -5,169 +5,125 @@ class DataExtract:
     Handles extraction of structured data from Spotify playlist JSON responses.
     
     This class provides methods to parse Spotify API playlist data and extract
-    information about albums, artists, and songs into structured dictionaries.
+    information about albums, artists, and songs into column-oriented dictionaries.
     It handles common data quality issues like None values and missing fields.
     
     Attributes:
-        playlist_data (dict): Raw Spotify playlist data from API response
+        playlist_pages (iterable[dict]): Raw Spotify playlist tracks pages from API responses
     """
     
-    def __init__(self, playlist_data):
+    def __init__(self, playlist_pages):
         """
         Initialize the DataExtract class with playlist data.
         
         Args:
-            playlist_data (dict): Spotify playlist data containing 'items' array
-                                with track information from the Spotify Web API
+            playlist_pages (iterable[dict] | dict): Spotify playlist tracks pages, each
+                                containing an 'items' array, as yielded by
+                                SpotifyConnection.iter_playlist_tracks. A single
+                                response dict is also accepted.
         """
-        self.playlist_data = playlist_data
+        if isinstance(playlist_pages, dict):
+            playlist_pages = [playlist_pages]
+        self.playlist_pages = playlist_pages
         
-    def extract_album_data(self):
+    def extract_all(self):
         """
-        Extract album information from playlist data.
+        Extract album, artist and song information in a single pass.
         
-        Parses through all tracks in the playlist and extracts album metadata
-        including ID, name, release date, track count, and Spotify URL.
-        
-        Args:
-            playlist_id (str): Spotify playlist identifier (for logging purposes)
+        Walks every track of every page once and appends album, artist and
+        song records at the same time, so pages can be consumed as they are
+        fetched instead of being held in memory and traversed three times.
+        Values are accumulated one list per column, ready to be handed
+        straight to pandas without building a dict per row. Albums, artists
+        and songs are deduplicated on their ID as they are seen, keeping the
+        first occurrence.
             
         Returns:
-            list[dict]: List of album dictionaries with keys:
-                - id: Album Spotify ID
-                - name: Album title
-                - release_date: Album release date string
-                - total_tracks: Number of tracks on album
-                - url: Spotify web URL for album
+            tuple[dict, dict, dict]: (album_cols, artist_cols, song_cols), each
+                mapping a column name to a list of values. Albums have keys:
+                - id, name, release_date, total_tracks, url
+                artists have keys (one entry per distinct track artist):
+                - id, name, url
+                songs have keys:
+                - id, name, added_at, duration_ms, popularity, url,
+                  album_id, artist_ids (primary album artist ID)
                 
         Raises:
-            Exception: Logs any parsing errors and continues processing
-        """
-        try:
-            album_list = []
-            for data in self.playlist_data['items']:
-                if data['track'] is None:  # Handle None tracks
-                    continue
-                album_id = data['track']['album']['id']
-                album_name = data['track']['album']['name']
-                album_release_date = data['track']['album']['release_date']
-                album_total_tracks = data['track']['album']['total_tracks']
-                album_url = data['track']['album']['external_urls']['spotify']
-
-                album_dict = {
-                    'id': album_id,
-                    'name': album_name,
-                    'release_date': album_release_date,
-                    'total_tracks': album_total_tracks,
-                    'url': album_url
-                }
-                album_list.append(album_dict)
-            logger.info(f"Data Extraction for album Succesfull with {len(album_list)} ")
-            return album_list
-        except Exception as e:
-            logger.info(f"Got Some error with exceptin {e}")
-
-    def extract_artist_data(self):
+            Exception: Errors raised while fetching pages propagate unchanged.
+                Items that cannot be parsed are logged and skipped.
         """
-        Extract artist information from playlist data.
-        
-        Iterates through all tracks and their associated artists to build
-        a comprehensive list of artist metadata. Handles tracks with multiple
-        artists by creating separate entries for each.
-        
-        Args:
-            playlist_id (str): Spotify playlist identifier (for logging purposes)
-            
-        Returns:
-            list[dict]: List of artist dictionaries with keys:
-                - id: Artist Spotify ID  
-                - name: Artist name
-                - url: Spotify web URL for artist profile
-                
-        Raises:
-            Exception: Logs any parsing errors and continues processing
-        """
-        try:
-
-            artist_list = []
-            for data in self.playlist_data['items']:
-                if data['track'] is None:  # Handle None tracks
+        album_ids, album_names, album_release_dates, album_total_tracks, album_urls = [], [], [], [], []
+        artist_ids, artist_names, artist_urls = [], [], []
+        song_ids, song_names, song_added_at, song_duration_ms = [], [], [], []
+        song_popularity, song_urls, song_album_ids, song_artist_ids = [], [], [], []
+        seen_album, seen_artist, seen_song = set(), set(), set()
+        for page in self.playlist_pages:
+            for data in page['items']:
+                track = data.get('track')
+                if track is None:  # Handle None tracks
                     continue
-                    
-                for artist in data['track']['artists']:
-                    artist_id = artist['id']
-                    artist_name = artist['name']
-                    artist_url = artist['external_urls']['spotify']
-                    artist_dict = {
-                        'id': artist_id,
-                        'name': artist_name,
-                        'url': artist_url
-                    }
-                    artist_list.append(artist_dict)
-            logger.info(f"Data Extraction for arist Succesfull with {len(artist_list)} ")
-            return artist_list
-        
-        except Exception as e:
-            logger.info(f"Got some error with exception {e}")
-
-    def extract_song_data(self):
-        """
-        Extract song/track information from playlist data.
-        
-        Processes each track in the playlist to extract comprehensive song
-        metadata including playback information, popularity metrics, and 
-        relationship data to albums and artists.
-        
-        Args:
-            playlist_data: Raw playlist data (parameter not used, uses self.playlist_data)
-            
-        Returns:
-            list[dict]: List of song dictionaries with keys:
-                - id: Track Spotify ID
-                - name: Track title
-                - added_at: Timestamp when track was added to playlist
-                - duration_ms: Track duration in milliseconds
-                - popularity: Spotify popularity score (0-100)
-                - url: Spotify web URL for track
-                - album_id: Associated album Spotify ID
-                - artist_ids: Primary artist Spotify ID
-                
-        Raises:
-            Exception: Logs any parsing errors and continues processing
-        """
-        try:
-
-            song_list = []
-            for data in self.playlist_data['items']:
-                if data['track'] is None:  # Handle None tracks
+                # Read every field before appending so a malformed item never
+                # leaves the column lists with different lengths
+                try:
+                    album = track['album']
+                    album_id = album['id']
+                    album_row = (
+                        album['name'], album['release_date'], album['total_tracks'],
+                        album['external_urls']['spotify']
+                    )
+                    artist_rows = [
+                        (artist['id'], artist['name'], artist['external_urls']['spotify'])
+                        for artist in track['artists']
+                    ]
+                    song_id = track['id']
+                    song_row = (
+                        track['name'], data['added_at'], track['duration_ms'], track['popularity'],
+                        track['external_urls']['spotify'], album['artists'][0]['id']
+                    )
+                except (KeyError, TypeError, IndexError) as e:
+                    logger.warning(f"Skipping malformed playlist item: {e!r}")
                     continue
-                    
-                song_id = data['track']['id']
-                song_name = data['track']['name']
-                song_duration_ms = data['track']['duration_ms']
-                song_popularity = data['track']['popularity']
-                song_url = data['track']['external_urls']['spotify']
-                song_added_at = data['added_at']
-                album_id = data['track']['album']['id']
-                artist_ids = data['track']['album']['artists'][0]['id']
 
-                song_dict = {
-                    'id': song_id,
-                    'name': song_name,
-                    'added_at': song_added_at,
-                    'duration_ms': song_duration_ms,
-                    'popularity': song_popularity,
-                    'url': song_url,
-                    'album_id': album_id,
-                    'artist_ids': artist_ids
-                }
-                song_list.append(song_dict)
-            logger.info(f"Data Extraction for Songs Succesfull with {len(song_list)} ")
-            return song_list
-        
-        except Exception as e:
-            logger.info(f"Got some Error with exception {e}")
-    
+                if album_id not in seen_album:
+                    seen_album.add(album_id)
+                    album_ids.append(album_id)
+                    album_names.append(album_row[0])
+                    album_release_dates.append(album_row[1])
+                    album_total_tracks.append(album_row[2])
+                    album_urls.append(album_row[3])
 
+                for artist_id, artist_name, artist_url in artist_rows:
+                    if artist_id in seen_artist:
+                        continue
+                    seen_artist.add(artist_id)
+                    artist_ids.append(artist_id)
+                    artist_names.append(artist_name)
+                    artist_urls.append(artist_url)
 
+                if song_id in seen_song:
+                    continue
+                seen_song.add(song_id)
+                song_ids.append(song_id)
+                song_names.append(song_row[0])
+                song_added_at.append(song_row[1])
+                song_duration_ms.append(song_row[2])
+                song_popularity.append(song_row[3])
+                song_urls.append(song_row[4])
+                song_album_ids.append(album_id)
+                song_artist_ids.append(song_row[5])
 
+        album_cols = {
+            'id': album_ids, 'name': album_names, 'release_date': album_release_dates,
+            'total_tracks': album_total_tracks, 'url': album_urls
+        }
+        artist_cols = {'id': artist_ids, 'name': artist_names, 'url': artist_urls}
+        song_cols = {
+            'id': song_ids, 'name': song_names, 'added_at': song_added_at,
+            'duration_ms': song_duration_ms, 'popularity': song_popularity, 'url': song_urls,
+            'album_id': song_album_ids, 'artist_ids': song_artist_ids
+        }
+        logger.opt(lazy=True).debug(
+            "Data Extraction Succesfull with {} albums, {} artists and {} songs",
+            lambda: len(album_ids), lambda: len(artist_ids), lambda: len(song_ids)
+        )
+        return album_cols, artist_cols, song_cols
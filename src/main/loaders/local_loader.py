@@ -6,7 +6,8 @@ class LoadDataLocal:
     """
     Handles local file persistence for transformed Spotify data.
     
-    Saves cleaned DataFrames to CSV files for local storage or analysis.
+    Saves cleaned DataFrames to Parquet or CSV files for local storage or analysis.
+    The format is picked from the file extension.
     Part of the ETL pipeline's Load stage.
     """
 
@@ -22,6 +23,15 @@ class LoadDataLocal:
         self.album_df = album_df
         self.artist_df = artist_df
         self.song_df = song_df
+        # Directories already created by this loader; per instance, so a later
+        # run still recreates directories cleaned up in between
+        self._dirs_made = set()
+
+    def _ensure_dir(self, directory):
+        """Create the directory once per loader; '' means the working directory."""
+        if directory and directory not in self._dirs_made:
+            os.makedirs(directory, exist_ok=True)
+            self._dirs_made.add(directory)
 
     def _validate_and_save(self, df, filepath, data_type):
         """Helper method to validate and save DataFrame."""
@@ -30,25 +40,28 @@ class LoadDataLocal:
             raise ValueError(f"No {data_type} data to save")
         
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        self._ensure_dir(os.path.dirname(filepath))
         
         try:
-            df.to_csv(filepath, index=False)
+            if filepath.endswith('.parquet'):
+                df.to_parquet(filepath, engine='pyarrow', compression='snappy', index=False)
+            else:
+                df.to_csv(filepath, index=False)
             logger.info(f"{data_type} data saved to {filepath} with shape {df.shape}")
         except Exception as e:
             logger.error(f"Failed to save {data_type} data to {filepath}: {e}")
             raise
 
     def load_album_data(self, filepath):
-        """Save album DataFrame to CSV file."""
+        """Save album DataFrame to a Parquet or CSV file."""
         self._validate_and_save(self.album_df, filepath, "Album")
     
     def load_artist_data(self, filepath):
-        """Save artist DataFrame to CSV file."""
+        """Save artist DataFrame to a Parquet or CSV file."""
         self._validate_and_save(self.artist_df, filepath, "Artist")
 
     def load_song_data(self, filepath):
-        """Save song DataFrame to CSV file."""
+        """Save song DataFrame to a Parquet or CSV file."""
         self._validate_and_save(self.song_df, filepath, "Song")
     
     def load_all(self, base_dir):
@@ -1,17 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from io import StringIO
+from io import BytesIO
 from loguru import logger
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+FILE_EXTENSIONS = {'parquet': 'parquet', 'csv': 'csv.gz'}
 
 class LoadDataS3:
     """
     Handles S3 persistence for transformed Spotify data.
     
-    Saves cleaned DataFrames to S3 buckets as CSV files.
+    Saves cleaned DataFrames to S3 buckets as gzip-compressed CSV files, or as
+    Snappy-compressed Parquet files when requested.
     Part of the ETL pipeline's Load stage for cloud storage.
     """
 
-    def __init__(self, album_df=None, artist_df=None, song_df=None, s3_connector=None, bucket_name=None):
+    def __init__(self, album_df=None, artist_df=None, song_df=None, s3_connector=None, bucket_name=None,
+                 file_format="csv"):
         """
         Initialize S3 loader with transformed DataFrames and S3 connection.
         
@@ -21,12 +28,18 @@ class LoadDataS3:
             song_df (pd.DataFrame): Transformed song data
             s3_connector (S3Connection): Instance of S3Connection class
             bucket_name (str): S3 bucket name for uploads
+            file_format (str): Output format, either 'csv' (default, gzipped) or 'parquet'.
+                The documented Snowpipe loads CSV; only switch to 'parquet' once the
+                stage and pipe use TYPE = PARQUET with MATCH_BY_COLUMN_NAME
         """
+        if file_format not in FILE_EXTENSIONS:
+            raise ValueError(f"Unsupported file format {file_format}")
         self.album_df = album_df
         self.artist_df = artist_df
         self.song_df = song_df
         self.s3_client = s3_connector.s3_client
         self.bucket_name = bucket_name
+        self.file_format = file_format
 
     def _validate_and_upload(self, df, s3_key, data_type):
         """
@@ -49,17 +62,25 @@ class LoadDataS3:
             logger.error(f"{data_type} data is None or empty")
             raise ValueError(f"No {data_type} data to upload")
         
-        # Convert DataFrame to CSV in memory
-        csv_buffer = StringIO()
-        df.to_csv(csv_buffer, index=False)
+        # Serialize DataFrame in memory
+        buffer = BytesIO()
+        if self.file_format == "parquet":
+            pq.write_table(pa.Table.from_pandas(df, preserve_index=False), buffer, compression='snappy')
+            upload_args = {'ContentType': 'application/octet-stream'}
+        else:
+            # pandas' CSV layout (unquoted fields, plain dates) is what the Snowpipe
+            # FILE_FORMAT = (TYPE = CSV) expects, so keep to_csv on this path
+            df.to_csv(buffer, index=False, compression={'method': 'gzip', 'compresslevel': 1})
+            upload_args = {'ContentType': 'text/csv', 'ContentEncoding': 'gzip'}
+        body = buffer.getvalue()
         
         try:
             # Upload to S3
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=s3_key,
-                Body=csv_buffer.getvalue(),
-                ContentType='text/csv'
+                Body=body,
+                **upload_args
             )
             
             s3_uri = f"s3://{self.bucket_name}/{s3_key}"
@@ -81,32 +102,37 @@ class LoadDataS3:
             str: S3 URI of uploaded file
         """
         timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        s3_key = f"{s3_prefix}/albums/albums_{timestamp}.csv"
+        s3_key = f"{s3_prefix}/albums/albums_{timestamp}.{FILE_EXTENSIONS[self.file_format]}"
         return self._validate_and_upload(self.album_df, s3_key, "Album")
 
     def load_artist_data_to_s3(self, s3_prefix="processed-data/spotify"):
         """Upload artist DataFrame to S3."""
         timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        s3_key = f"{s3_prefix}/artists/artists_{timestamp}.csv"
+        s3_key = f"{s3_prefix}/artists/artists_{timestamp}.{FILE_EXTENSIONS[self.file_format]}"
         return self._validate_and_upload(self.artist_df, s3_key, "Artist")
 
     def load_song_data_to_s3(self, s3_prefix="processed-data/spotify"):
         """Upload song DataFrame to S3."""
         timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        s3_key = f"{s3_prefix}/songs/songs_{timestamp}.csv"
+        s3_key = f"{s3_prefix}/songs/songs_{timestamp}.{FILE_EXTENSIONS[self.file_format]}"
         return self._validate_and_upload(self.song_df, s3_key, "Song")
     
     def load_all_to_s3(self, s3_prefix="processed-data/spotify"):
         """
         Upload all DataFrames to S3 in one call.
         
+        The three uploads are independent and network-bound, so they run
+        concurrently on a thread pool sharing the same S3 client.
+        
         Returns:
             dict: S3 URIs for all uploaded files
         """
-        uploaded_files = {
-            'albums': self.load_album_data_to_s3(s3_prefix),
-            'artists': self.load_artist_data_to_s3(s3_prefix),
-            'songs': self.load_song_data_to_s3(s3_prefix)
-        }
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                'albums': executor.submit(self.load_album_data_to_s3, s3_prefix),
+                'artists': executor.submit(self.load_artist_data_to_s3, s3_prefix),
+                'songs': executor.submit(self.load_song_data_to_s3, s3_prefix)
+            }
+            uploaded_files = {name: future.result() for name, future in futures.items()}
         logger.info(f"All data uploaded to S3 under {s3_prefix}")
         return uploaded_files
\ No newline at end of file
@@ -1,24 +1,24 @@
 from loguru import logger
 import pandas as pd
+from src.main.extractors.spotify_extractor import DataExtract
 
 class TransformData:
     """
     Handles data transformation and cleaning operations on extracted Spotify data.
     
-    This class inherits from DataExtract and adds transformation capabilities
-    to convert raw extracted data into clean, analysis-ready pandas DataFrames.
-    It performs deduplication, data type conversions, and data quality improvements.
-    
-    Inherits all extraction methods from DataExtract and adds transformation logic.
+    This class takes the columns produced by DataExtract.extract_all and
+    converts them into clean, analysis-ready pandas DataFrames.
+    It performs data type conversions and data quality improvements; rows arrive
+    already deduplicated on their ID from DataExtract.extract_all.
     """
     def __init__(self, album_data=None, artist_data=None, song_data=None):
         """
         Initialize transformer with already-extracted data.
         
         Args:
-            album_data (list): Extracted album data from DataExtract
-            artist_data (list): Extracted artist data from DataExtract  
-            song_data (list): Extracted song data from DataExtract
+            album_data (dict): Extracted album columns from DataExtract
+            artist_data (dict): Extracted artist columns from DataExtract  
+            song_data (dict): Extracted song columns from DataExtract
         """
         self.album_data = album_data
         self.artist_data = artist_data
@@ -29,7 +29,6 @@ class TransformData:
         Transform raw album data into a clean pandas DataFrame.
         
         Applies data cleaning operations including:
-        - Deduplication based on album ID
         - Date parsing and conversion to datetime format
         - Data quality logging and validation
         
@@ -43,15 +42,18 @@ class TransformData:
         """
         try:
 
-            album_df = pd.DataFrame(self.album_data)
-            # Droping duplicates based on 'id' column
-            album_df = album_df.drop_duplicates(subset=['id'])
-            # Converting release_date to datetime format
-            album_df['release_date'] = pd.to_datetime(album_df['release_date'], errors='coerce')
-            logger.info(f"Album Data transformed to DataFrame with shape {album_df.shape}")
+            album_df = pd.DataFrame(self.album_data, copy=False)
+            # Converting release_date to datetime format; ISO8601 also covers the
+            # 'YYYY' and 'YYYY-MM' precisions Spotify returns for older albums
+            album_df['release_date'] = pd.to_datetime(
+                album_df['release_date'], format='ISO8601', errors='coerce', cache=True
+            )
+            # Arrow-backed strings are far more compact than Python object strings
+            album_df['url'] = album_df['url'].astype('string[pyarrow]')
+            logger.opt(lazy=True).debug("Album Data transformed to DataFrame with shape {}", lambda: album_df.shape)
             return album_df
-        except Exception as e:
-            logger.error(f"Error transforming album data: {e}")
+        except Exception:
+            logger.exception("Error transforming album data")
             return pd.DataFrame()
 
     def transform_artist_data(self):
@@ -59,25 +61,20 @@ class TransformData:
         Transform raw artist data into a clean pandas DataFrame.
         
         Applies data cleaning operations including:
-        - Deduplication based on artist ID to handle artists appearing multiple times
         - Data structure validation and logging
         
-        Args:
-            playlist_id (str): Spotify playlist identifier
-            
         Returns:
             pandas.DataFrame: Cleaned artist data with columns:
                 - id, name, url
         """
         try:
 
-            artist_df = pd.DataFrame(self.artist_data)
-            # Droping duplicates based on 'id' column
-            artist_df = artist_df.drop_duplicates(subset=['id'])
-            logger.info(f"Artist Data transformed to DataFrame with shape {artist_df.shape}")
+            artist_df = pd.DataFrame(self.artist_data, copy=False)
+            artist_df['url'] = artist_df['url'].astype('string[pyarrow]')
+            logger.opt(lazy=True).debug("Artist Data transformed to DataFrame with shape {}", lambda: artist_df.shape)
             return artist_df
-        except Exception as e:
-            logger.error(f"Error transforming artist data: {e}")
+        except Exception:
+            logger.exception("Error transforming artist data")
             return pd.DataFrame()
 
     def transform_song_data(self):
@@ -85,29 +82,56 @@ class TransformData:
         Transform raw song data into a clean pandas DataFrame.
         
         Applies comprehensive data cleaning including:
-        - Deduplication based on track ID
         - Timestamp parsing for playlist addition dates
         - Data validation and quality logging
         
-        Args:
-            playlist_id (str): Spotify playlist identifier
-            
         Returns:
             pandas.DataFrame: Cleaned song data with columns:
                 - id, name, added_at (datetime), duration_ms, popularity, 
-                  url, album_id, artist_ids
+                  url, album_id (category), artist_ids (category)
                   
         Note:
             The added_at timestamp indicates when the track was added to the playlist
         """
         try:
-            song_df = pd.DataFrame(self.song_data)
-            # Droping duplicates based on 'id' column
-            song_df = song_df.drop_duplicates(subset=['id'])
+            song_df = pd.DataFrame(self.song_data, copy=False)
             # Converting added_at to datetime format
-            song_df['added_at'] = pd.to_datetime(song_df['added_at'], errors='coerce')
-            logger.info(f"Song Data transformed to DataFrame with shape {song_df.shape}")
+            song_df['added_at'] = pd.to_datetime(
+                song_df['added_at'], format='%Y-%m-%dT%H:%M:%SZ', errors='coerce', utc=True, cache=True
+            )
+            # Album and artist IDs repeat across songs, so store them as categories
+            for col in ('album_id', 'artist_ids'):
+                song_df[col] = song_df[col].astype('category')
+            logger.opt(lazy=True).debug("Song Data transformed to DataFrame with shape {}", lambda: song_df.shape)
             return song_df
-        except Exception as e:
-            logger.error(f"Error transforming song data: {e}")
-            return pd.DataFrame()
\ No newline at end of file
+        except Exception:
+            logger.exception("Error transforming song data")
+            return pd.DataFrame()
+
+
+def build_dataframes(playlist_pages):
+    """
+    Extract and transform playlist pages into album, artist and song DataFrames.
+
+    Pages are streamed through DataExtract.extract_all in a single pass and the
+    resulting columns are handed straight to TransformData. Each entity's column
+    lists are released as soon as its DataFrame is built, so the lists and the
+    finished frames are never all held in memory at once.
+
+    Args:
+        playlist_pages (iterable[dict]): Playlist tracks pages, as yielded by
+            SpotifyConnection.iter_playlist_tracks
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: (album_df, artist_df, song_df)
+    """
+    transformer = TransformData(*DataExtract(playlist_pages).extract_all())
+
+    album_df = transformer.transform_album_data()
+    transformer.album_data = None
+    artist_df = transformer.transform_artist_data()
+    transformer.artist_data = None
+    song_df = transformer.transform_song_data()
+    transformer.song_data = None
+
+    return album_df, artist_df, song_df